@@ -12,6 +12,7 @@ from pydantic import Field, PrivateAttr
 from structlog.stdlib import BoundLogger
 
 from llm_facade.llm_config import LLMConfig
+from llm_facade.llm_facade import CLOSE_STREAM_KWARG
 
 
 @final
@@ -64,8 +65,15 @@ class GemaVllm(CustomLLM):
             stream=True,
         )
 
-        for chunk in stream:
-            if chunk.choices and chunk.choices[0].delta.content is not None:
-                content = chunk.choices[0].delta.content.replace("ß", "ss")
-                response += content
-                yield CompletionResponse(text=response, delta=content)
+        # Closing the stream drops the HTTP connection, which makes vLLM abort the request.
+        # The facade closes it via CLOSE_STREAM_KWARG, as this generator may never be finalized.
+        with stream:
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content is not None:
+                    content = chunk.choices[0].delta.content.replace("ß", "ss")
+                    response += content
+                    yield CompletionResponse(
+                        text=response,
+                        delta=content,
+                        additional_kwargs={CLOSE_STREAM_KWARG: stream.close},
+                    )
@@ -1,4 +1,5 @@
-from collections.abc import Generator
+import re
+from collections.abc import Callable, Generator
 from typing import Any, TypeVar, cast
 
 from llama_index.core.llms import LLM
@@ -7,40 +8,134 @@ from pydantic import BaseModel
 
 T = TypeVar("T", bound=BaseModel)
 
+CLOSE_STREAM_KWARG = "close_stream"
+"""Key in `CompletionResponse.additional_kwargs` under which streaming LLMs expose a callable closing the upstream stream."""
+
 
 class LLMFacade:
     def __init__(self, llm: LLM):
         self.llm = llm
 
-    def complete(self, prompt: str, **kwargs: Any) -> str:
+    def complete(
+        self,
+        prompt: str,
+        *,
+        stop_pattern: str | re.Pattern[str] | None = None,
+        max_chars: int | None = None,
+        stop_when: Callable[[str], bool] | None = None,
+        **kwargs: Any,
+    ) -> str:
         """
         Complete a prompt using the LLM.
 
+        If any stop condition is given, the completion is streamed and the upstream
+        request is cancelled as soon as a condition fires (see `stream_complete`).
+
         Args:
             prompt: The input prompt
+            stop_pattern: Stop once this regex matches the text; the text ends with the match
+            max_chars: Stop once this many characters have been produced, must be at least 1
+            stop_when: Stop once this callback returns True for the text produced so far
             **kwargs: Additional parameters to pass to the completion API
 
         Returns:
             The completed text from the LLM
+
+        Raises:
+            ValueError: If max_chars is less than 1
         """
-        response = self.llm.complete(prompt, **kwargs)
-        return response.text
+        if stop_pattern is None and max_chars is None and stop_when is None:
+            response = self.llm.complete(prompt, **kwargs)
+            return response.text
+
+        return "".join(
+            self.stream_complete(
+                prompt,
+                stop_pattern=stop_pattern,
+                max_chars=max_chars,
+                stop_when=stop_when,
+                **kwargs,
+            )
+        )
 
-    def stream_complete(self, prompt: str, **kwargs: Any) -> Generator[str, None, None]:
+    def stream_complete(
+        self,
+        prompt: str,
+        *,
+        stop_pattern: str | re.Pattern[str] | None = None,
+        max_chars: int | None = None,
+        stop_when: Callable[[str], bool] | None = None,
+        **kwargs: Any,
+    ) -> Generator[str, None, None]:
         """
         Stream a completion using the LLM.
 
+        When a stop condition fires, the upstream stream is closed before the final
+        delta is yielded, so the server can abort generation. Closing this generator
+        early closes the upstream stream as well. This requires the LLM to expose a
+        close callable under `CLOSE_STREAM_KWARG` in each response's `additional_kwargs`.
+
+        A regex match that ends exactly at the end of the text received so far only
+        stops the stream once more text follows it, since the next delta may extend
+        or invalidate the match (e.g. `\\b`, `$` or greedy quantifiers). Patterns with a
+        lookahead may only match once the text they look at has been yielded; the output
+        then ends with that already yielded text instead of the match.
+
+        Early stops are reported by llama_index's completion instrumentation as an
+        exception event carrying `GeneratorExit`; this is expected and not an LLM failure.
+
         Args:
             prompt: The input prompt
+            stop_pattern: Stop once this regex matches the text; the text ends with the match
+            max_chars: Stop once this many characters have been produced, must be at least 1
+            stop_when: Stop once this callback returns True for the text produced so far
             **kwargs: Additional parameters to pass to the completion API
 
         Returns:
             The streamed text from the LLM
+
+        Raises:
+            ValueError: If max_chars is less than 1
         """
+        if max_chars is not None and max_chars < 1:
+            msg = f"max_chars must be at least 1, got {max_chars}"
+            raise ValueError(msg)
+
+        pattern = re.compile(stop_pattern) if isinstance(stop_pattern, str) else stop_pattern
+        return self._stream_until_stop(prompt, pattern, max_chars, stop_when, **kwargs)
 
-        for completion in self.llm.stream_complete(prompt, **kwargs):
-            if completion.delta is not None:
-                yield completion.delta
+    def _stream_until_stop(
+        self,
+        prompt: str,
+        pattern: re.Pattern[str] | None,
+        max_chars: int | None,
+        stop_when: Callable[[str], bool] | None,
+        **kwargs: Any,
+    ) -> Generator[str, None, None]:
+        stream = self.llm.stream_complete(prompt, **kwargs)
+        close_upstream: Callable[[], None] | None = None
+        text = ""
+
+        try:
+            for completion in stream:
+                close_upstream = completion.additional_kwargs.get(CLOSE_STREAM_KWARG, close_upstream)
+                if completion.delta is None:
+                    continue
+
+                emitted = len(text)
+                text += completion.delta
+                stop_at = _find_stop(text, pattern, max_chars, stop_when)
+
+                if stop_at is None:
+                    yield completion.delta
+                    continue
+
+                _close(stream, close_upstream)
+                if stop_at > emitted:
+                    yield text[emitted:stop_at]
+                return
+        finally:
+            _close(stream, close_upstream)
 
     def structured_predict[T](
         self,
@@ -63,3 +158,33 @@ class LLMFacade:
         sllm = self.llm.as_structured_llm(cast(type[BaseModel], response_type))
         response: T = sllm.structured_predict(response_type, prompt, llm_kwargs=llm_kwargs, **prompt_args)
         return response
+
+
+def _find_stop(
+    text: str,
+    pattern: re.Pattern[str] | None,
+    max_chars: int | None,
+    stop_when: Callable[[str], bool] | None,
+) -> int | None:
+    """Return the index at which the text should be cut, or None to keep streaming."""
+    stops: list[int] = []
+
+    # A match ending at the end of the buffer may still change with the next delta.
+    if pattern is not None and (match := pattern.search(text)) is not None and match.end() < len(text):
+        stops.append(match.end())
+    if max_chars is not None and len(text) >= max_chars:
+        stops.append(max_chars)
+    if stop_when is not None and stop_when(text):
+        stops.append(len(text))
+
+    return min(stops, default=None)
+
+
+def _close(stream: Any, close_upstream: Callable[[], None] | None) -> None:
+    """Close the upstream HTTP stream and the completion generator wrapping it."""
+    # Closing `stream` alone is not enough: llama_index's callback wrapper does not close the
+    # LLM's inner generator, and callback handlers retaining the `GeneratorExit` keep it alive.
+    if close_upstream is not None:
+        close_upstream()
+    if isinstance(stream, Generator):
+        stream.close()
@@ -7,6 +7,7 @@ from pydantic import Field, PrivateAttr
 from structlog.stdlib import BoundLogger
 
 from llm_facade.llm_config import LLMConfig
+from llm_facade.llm_facade import CLOSE_STREAM_KWARG
 
 
 @final
@@ -107,14 +108,25 @@ class QwenVllm(CustomLLM):
             stream=True,
         )
 
-        for chunk in stream:
-            if chunk.choices and chunk.choices[0].delta.content is not None:
-                content = chunk.choices[0].delta.content.replace("ß", "ss")
-                response += content
-                yield CompletionResponse(text=response, delta=content)
-
-            # Handle tool calls in streaming mode
-            if chunk.choices and hasattr(chunk.choices[0].delta, "tool_calls") and chunk.choices[0].delta.tool_calls:
-                # For tool calls in streaming, we just log them but actual tool execution
-                # should be handled by the caller after the stream is complete
-                self.last_log = f"Tool call received in chunk: {chunk.model_dump_json()}"
+        # Closing the stream drops the HTTP connection, which makes vLLM abort the request.
+        # The facade closes it via CLOSE_STREAM_KWARG, as this generator may never be finalized.
+        with stream:
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content is not None:
+                    content = chunk.choices[0].delta.content.replace("ß", "ss")
+                    response += content
+                    yield CompletionResponse(
+                        text=response,
+                        delta=content,
+                        additional_kwargs={CLOSE_STREAM_KWARG: stream.close},
+                    )
+
+                # Handle tool calls in streaming mode
+                if (
+                    chunk.choices
+                    and hasattr(chunk.choices[0].delta, "tool_calls")
+                    and chunk.choices[0].delta.tool_calls
+                ):
+                    # For tool calls in streaming, we just log them but actual tool execution
+                    # should be handled by the caller after the stream is complete
+                    self.last_log = f"Tool call received in chunk: {chunk.model_dump_json()}"
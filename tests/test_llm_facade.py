@@ -1,10 +1,14 @@
+from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
+from llama_index.core.callbacks import CallbackManager, LlamaDebugHandler
+from llama_index.core.llms import CompletionResponse, CompletionResponseGen, CustomLLM, LLMMetadata
+from llama_index.core.llms.callbacks import llm_completion_callback
 from llama_index.core.prompts import PromptTemplate
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
-from llm_facade.llm_facade import LLMFacade
+from llm_facade.llm_facade import CLOSE_STREAM_KWARG, LLMFacade
 
 
 class MockResponseModel(BaseModel):
@@ -85,7 +89,7 @@ def test_structured_predict() -> None:
 
     # Check that LLM's as_structured_llm method was called
     mock_llm.as_structured_llm.assert_called_once()
-    
+
     # Check that structured_llm's structured_predict method was called with the right arguments
     mock_structured_llm.structured_predict.assert_called_once_with(
         MockResponseModel,
@@ -98,3 +102,182 @@ def test_structured_predict() -> None:
     assert result == expected_response
     assert result.response == "Test response"
     assert result.confidence == 0.9
+
+
+class StreamingLLM(CustomLLM):
+    """A streaming LLM behind llama_index's completion callback that records how it was consumed."""
+
+    deltas: list[str]
+    pulled: list[str] = Field(default_factory=list)
+    prompts: list[str] = Field(default_factory=list)
+    upstream_closed: bool = False
+    generator_finalized: bool = False
+
+    @property
+    def metadata(self) -> LLMMetadata:
+        return LLMMetadata(model_name="streaming-test")
+
+    @llm_completion_callback()
+    def complete(self, prompt: str, **kwargs: Any) -> CompletionResponse:
+        pytest.fail("complete should not be called")
+
+    @llm_completion_callback()
+    def stream_complete(self, prompt: str, **kwargs: Any) -> CompletionResponseGen:
+        self.prompts.append(prompt)
+
+        def close() -> None:
+            self.upstream_closed = True
+
+        text = ""
+        try:
+            for delta in self.deltas:
+                if self.upstream_closed:
+                    pytest.fail("stream read after close")
+                self.pulled.append(delta)
+                text += delta
+                yield CompletionResponse(text=text, delta=delta, additional_kwargs={CLOSE_STREAM_KWARG: close})
+        finally:
+            self.generator_finalized = True
+
+
+def test_stream_complete_stop_pattern() -> None:
+    """Test that stream_complete cuts the text at the end of the first regex match and stops pulling."""
+    llm = StreamingLLM(deltas=["The answer", " is: y", "es. Because", " reasons", "..."])
+    facade = LLMFacade(llm)
+
+    result = list(facade.stream_complete("Test prompt", stop_pattern=r"\b(yes|no)\b"))
+
+    assert "".join(result) == "The answer is: yes"
+    assert llm.pulled == ["The answer", " is: y", "es. Because"]
+    assert llm.upstream_closed
+
+
+def test_stream_complete_stop_pattern_waits_at_delta_boundary() -> None:
+    """Test that a match ending at a delta boundary is re-checked against the next delta."""
+    llm = StreamingLLM(deltas=["Answer: no", "thing to add. yes", " indeed", "..."])
+    facade = LLMFacade(llm)
+
+    result = list(facade.stream_complete("Test prompt", stop_pattern=r"\b(yes|no)\b"))
+
+    assert "".join(result) == "Answer: nothing to add. yes"
+    assert llm.pulled == ["Answer: no", "thing to add. yes", " indeed"]
+
+
+def test_stream_complete_stop_pattern_greedy_match() -> None:
+    """Test that a greedy match is not cut short by a delta boundary."""
+    llm = StreamingLLM(deltas=["Total: 1", "25 items", " in stock"])
+    facade = LLMFacade(llm)
+
+    result = list(facade.stream_complete("Test prompt", stop_pattern=r"\d+"))
+
+    assert "".join(result) == "Total: 125"
+
+
+def test_stream_complete_stop_pattern_match_at_stream_end() -> None:
+    """Test that a match at the very end of the stream keeps the full text."""
+    llm = StreamingLLM(deltas=["Answer: ", "yes"])
+    facade = LLMFacade(llm)
+
+    result = list(facade.stream_complete("Test prompt", stop_pattern=r"\b(yes|no)\b"))
+
+    assert "".join(result) == "Answer: yes"
+
+
+def test_stream_complete_stop_pattern_lookahead_overshoots() -> None:
+    """Test that a lookahead match found after its text was yielded stops without taking text back."""
+    llm = StreamingLLM(deltas=["xab", "c yyy", " zzz"])
+    facade = LLMFacade(llm)
+
+    result = list(facade.stream_complete("Test prompt", stop_pattern=r"a(?=bc)"))
+
+    assert "".join(result) == "xab"
+    assert llm.pulled == ["xab", "c yyy"]
+    assert llm.upstream_closed
+
+
+def test_stream_complete_max_chars() -> None:
+    """Test that stream_complete stops after max_chars characters."""
+    llm = StreamingLLM(deltas=["Hello", " World", "!"])
+    facade = LLMFacade(llm)
+
+    result = list(facade.stream_complete("Test prompt", max_chars=7))
+
+    assert result == ["Hello", " W"]
+    assert llm.pulled == ["Hello", " World"]
+
+
+@pytest.mark.parametrize("max_chars", [0, -1])
+def test_stream_complete_rejects_max_chars_below_one(max_chars: int) -> None:
+    """Test that max_chars below 1 is rejected before any request is sent."""
+    llm = StreamingLLM(deltas=["Hello"])
+    facade = LLMFacade(llm)
+
+    with pytest.raises(ValueError, match="max_chars"):
+        facade.stream_complete("Test prompt", max_chars=max_chars)
+    with pytest.raises(ValueError, match="max_chars"):
+        facade.complete("Test prompt", max_chars=max_chars)
+
+    assert llm.prompts == []
+
+
+def test_stream_complete_stop_when() -> None:
+    """Test that stream_complete stops once the callback returns True for the accumulated text."""
+    llm = StreamingLLM(deltas=['["a",', ' "b"]', ", trailing"])
+    facade = LLMFacade(llm)
+
+    result = list(facade.stream_complete("Test prompt", stop_when=lambda text: "]" in text))
+
+    assert "".join(result) == '["a", "b"]'
+    assert llm.pulled == ['["a",', ' "b"]']
+
+
+def test_stream_complete_closes_upstream_before_last_delta() -> None:
+    """Test that the upstream stream is closed before the final delta is handed out."""
+    llm = StreamingLLM(deltas=["x"] * 10)
+    facade = LLMFacade(llm)
+
+    gen = facade.stream_complete("Test prompt", max_chars=3)
+    assert [next(gen), next(gen)] == ["x", "x"]
+    assert not llm.upstream_closed
+    assert next(gen) == "x"
+    assert llm.upstream_closed
+
+
+def test_stream_complete_closes_upstream_when_abandoned() -> None:
+    """Test that closing the facade generator early closes the upstream stream."""
+    llm = StreamingLLM(deltas=["x"] * 10)
+    facade = LLMFacade(llm)
+
+    gen = facade.stream_complete("Test prompt")
+    assert next(gen) == "x"
+    gen.close()
+
+    assert llm.upstream_closed
+
+
+def test_stream_complete_closes_upstream_with_retaining_callback_handler() -> None:
+    """Test that cancellation does not depend on the LLM generator being finalized.
+
+    LlamaDebugHandler keeps the `GeneratorExit` reported by the completion callback, whose
+    traceback keeps the LLM's generator alive.
+    """
+    debug_handler = LlamaDebugHandler()
+    llm = StreamingLLM(deltas=["x"] * 10, callback_manager=CallbackManager([debug_handler]))
+    facade = LLMFacade(llm)
+
+    result = facade.complete("Test prompt", max_chars=3)
+
+    assert result == "xxx"
+    assert llm.upstream_closed
+    assert llm.pulled == ["x"] * 3
+
+
+def test_complete_with_stop_condition() -> None:
+    """Test that complete streams and joins the text when a stop condition is given."""
+    llm = StreamingLLM(deltas=["Hello", " World", "!"])
+    facade = LLMFacade(llm)
+
+    result = facade.complete("Test prompt", stop_pattern="World", temperature=0.5)
+
+    assert llm.prompts == ["Test prompt"]
+    assert result == "Hello World"
@@ -1,6 +1,16 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+from llama_index.core.callbacks import CallbackManager, LlamaDebugHandler
+from llama_index.core.callbacks.base_handler import BaseCallbackHandler
 from structlog import get_logger
 
 from llm_facade.llm_config import LLMConfig
+from llm_facade.llm_facade import LLMFacade
 from llm_facade.qwen3 import QwenVllm
 
 
@@ -16,3 +26,72 @@ def test_ctor() -> None:
     llm = QwenVllm(config=config, logger=logger)
 
     assert llm.config.openai_api_base_url == config.openai_api_base_url
+
+
+def _stub_vllm_handler() -> type[BaseHTTPRequestHandler]:
+    """Create a handler class with fresh state, so runs cannot observe each other's disconnects."""
+
+    class StubVllmHandler(BaseHTTPRequestHandler):
+        """Serves an endless SSE chat completion stream and records when the client disconnects."""
+
+        disconnected = threading.Event()
+        chunks_sent = 0
+
+        def do_POST(self) -> None:
+            self.rfile.read(int(self.headers["Content-Length"]))
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.end_headers()
+
+            try:
+                for i in range(500):
+                    chunk = {
+                        "id": "stub",
+                        "object": "chat.completion.chunk",
+                        "created": 0,
+                        "model": "test-model",
+                        "choices": [{"index": 0, "delta": {"content": f"token{i} "}, "finish_reason": None}],
+                    }
+                    self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+                    self.wfile.flush()
+                    StubVllmHandler.chunks_sent += 1
+                    time.sleep(0.01)
+                self.wfile.write(b"data: [DONE]\n\n")
+            except (BrokenPipeError, ConnectionResetError):
+                StubVllmHandler.disconnected.set()
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    return StubVllmHandler
+
+
+@pytest.mark.parametrize("handlers", [[], [LlamaDebugHandler()]], ids=["no-handler", "retaining-handler"])
+def test_stream_complete_cancels_server_request(handlers: list[BaseCallbackHandler]) -> None:
+    """Test that a fired stop condition closes the HTTP stream on the server side.
+
+    LlamaDebugHandler retains the `GeneratorExit` of the stopped completion, which keeps
+    the QwenVllm generator from being finalized.
+    """
+    handler = _stub_vllm_handler()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        config = LLMConfig(
+            openai_api_key="test-key",
+            openai_api_base_url=f"http://127.0.0.1:{server.server_port}/v1",
+            llm_model="test-model",
+        )
+        facade = LLMFacade(QwenVllm(config=config, logger=get_logger(), callback_manager=CallbackManager(handlers)))
+
+        result = facade.complete("Test prompt", stop_pattern=r"token2\b")
+
+        assert result == "token0 token1 token2"
+        assert handler.disconnected.wait(timeout=5)
+        # The stop fires on the third chunk; the server notices within a few writes after that.
+        assert handler.chunks_sent <= 3 + 5
+    finally:
+        server.shutdown()
+        server.server_close()